@@ -26,13 +26,17 @@ __version__ = "0.2.1"
 # SOFTWARE.
 
 import argparse
-import collections
+import collections.abc
 import csv
 import dataclasses
+import io
 import itertools
 import json
 import logging
+import mmap
+import operator
 import struct
+import sys
 from typing import (
     Any,
     BinaryIO,
@@ -44,10 +48,14 @@ from typing import (
     Optional,
     TextIO,
     Tuple,
-    TypeVar,
     Union,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # pylint: disable=invalid-name
+
 # Logger used by the CLI program
 logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
 
@@ -108,48 +116,43 @@ def hash_cof_name(cof_name: str) -> int:
     # Based on:
     #   https://d2mods.info/forum/viewtopic.php?p=24163#p24163
     #   https://d2mods.info/forum/viewtopic.php?p=24295#p24295
-    return sum(map(ord, cof_name.upper())) % 256
-
+    try:
+        # Iterating over bytes yields integers directly, so this avoids ord()
+        return sum(cof_name.encode("ascii").upper()) % 256
+    except UnicodeEncodeError:
+        return sum(map(ord, cof_name.upper())) % 256
 
-_T = TypeVar("_T")
-_V = TypeVar("_V")
 
+FRAME_MAX = 144
 
-# Based on https://docs.python.org/3/howto/descriptor.html#properties
-class _ManagedProperty:
-    """Managed, required property for use with dataclasses."""
 
-    def __init__(
-        self, class_: type, name: str, validator: Optional[Callable[..., _V]] = None
-    ) -> None:
-        setattr(class_, name, self)
-        self._name = name
-        self._validator = validator
-        # Prevent pydocmd from generating a subsection for managed properties
-        self.__doc__ = None
+def _check_trigger(frame: int, code: int) -> None:
+    """Checks if a frame index and trigger code can be stored in ActionTriggers.
 
-    def __get__(self, obj: _T, owner: Optional[type] = None) -> _V:
-        # If accessed as Class.property, return myself (the property object)
-        if obj is None:
-            return self
-        # If accessed as obj.property, return the actual value
-        # Bypass __getattribute__() to prevent infinite loop
-        return obj.__dict__[self._name]
+    :raise TypeError: If `frame` or `code` is not an integer.
+    :raise ValueError: If `frame` or `code` is out of range.
+    """
+    if not isinstance(frame, int):
+        raise TypeError(f"frame must be an integer (got {frame!r})")
+    if not 0 <= frame < FRAME_MAX:
+        raise ValueError(f"frame must be between 0 and {FRAME_MAX - 1} (got {frame!r})")
+    if not isinstance(code, int):
+        raise TypeError(f"code must be an integer (got {code!r})")
+    if not 1 <= code <= 3:
+        raise ValueError(f"code must be between 1 and 3 (got {code!r})")
 
-    def __set__(self, obj: _T, value: Any) -> None:
-        # pylint: disable=attribute-defined-outside-init
-        # Bypass __getattribute__() to prevent infinite loop
-        obj.__dict__[self._name] = self._validator(value)
 
-    def __call__(self, validator: Callable[..., _V]) -> Callable[..., _V]:
-        # Make this instance usable as a decorator
-        self._validator = validator
+def _last_frame(triggers: dict) -> int:
+    """Returns the last frame of a nonempty, sorted ActionTriggers."""
+    return next(reversed(triggers))
 
 
-FRAME_MAX = 144
+if sys.version_info < (3, 8):
+    # Dicts are not reversible before Python 3.8, but the last frame is the largest
+    _last_frame = max
 
 
-class ActionTriggers(collections.UserDict):
+class ActionTriggers(dict):
     """Specialized dictionary that maps frame indices to trigger codes.
 
     Example usage:
@@ -179,45 +182,125 @@ class ActionTriggers(collections.UserDict):
     # Iteration order: (7, 1), (10, 2)
     for frame, code in triggers.items():
     ```
+
+    ActionTriggers is a subclass of `dict`. Older versions subclassed
+    `collections.UserDict`, and had a `data` attribute that is now removed.
     """
 
-    # pylint: disable=too-many-ancestors
+    # Subclass dict so that reads run in C. Items are kept sorted by frame.
+    __slots__ = ()
+
+    def __init__(self, other: Any = None, **kwargs: Any) -> None:
+        # pylint: disable=super-init-not-called
+        # dict.__init__() would not validate items. Like UserDict, None is empty.
+        if other is not None or kwargs:
+            self.update(() if other is None else other, **kwargs)
 
     def __setitem__(self, frame, code) -> None:
-        if not isinstance(frame, int):
-            raise TypeError(f"frame must be an integer (got {frame!r})")
-        if not 0 <= frame < FRAME_MAX:
-            raise ValueError(
-                f"frame must be between 0 and {FRAME_MAX - 1} (got {frame!r})"
-            )
+        _check_trigger(frame, code)
+        # Only a new frame before the last (i.e. largest) frame breaks the order
+        out_of_order = frame not in self and self and frame < _last_frame(self)
+        dict.__setitem__(self, frame, code)
+        if out_of_order:
+            self._sort_frames()
+
+    def __or__(self, other: Any) -> "ActionTriggers":
+        if not isinstance(other, collections.abc.Mapping):
+            return NotImplemented
+        new = self.copy()
+        new.update(other)
+        return new
+
+    def __ror__(self, other: Any) -> "ActionTriggers":
+        if not isinstance(other, collections.abc.Mapping):
+            return NotImplemented
+        new = type(self)(other)
+        new.update(self)
+        return new
+
+    def __ior__(self, other: Any) -> "ActionTriggers":
+        self.update(other)
+        return self
+
+    def update(self, other: Any = (), **kwargs: Any) -> None:
+        """Adds triggers from a mapping or an iterable of (frame, code) pairs.
+
+        All triggers are validated before any of them are added.
+
+        :raise TypeError: If a frame or code is not an integer.
+        :raise ValueError: If a frame or code is invalid.
+        """
+        triggers = dict(other, **kwargs)
+        for frame, code in triggers.items():
+            _check_trigger(frame, code)
+        dict.update(self, triggers)
+        if list(self) != sorted(self):
+            self._sort_frames()
 
-        if not isinstance(code, int):
-            raise TypeError(f"code must be an integer (got {code!r})")
-        if not 1 <= code <= 3:
-            raise ValueError(f"code must be between 1 and 3 (got {code!r})")
+    # Validate new items, like UserDict does
+    setdefault = collections.abc.MutableMapping.setdefault
 
-        self.data[frame] = code
+    def popitem(self) -> Tuple[int, int]:
+        """Removes and returns the trigger with the lowest frame index.
 
-    def __iter__(self) -> Iterator[int]:
-        return iter(sorted(self.data))
+        :return: Tuple of `(frame, code)`.
+        :raise KeyError: If there are no triggers.
+        """
+        for frame in self:
+            return frame, self.pop(frame)
+        raise KeyError("popitem(): ActionTriggers is empty")
+
+    def copy(self) -> "ActionTriggers":
+        """Returns a shallow copy of the ActionTriggers."""
+        obj = type(self)()
+        dict.update(obj, self)  # The items have already been validated
+        return obj
 
-    def to_codes(self) -> Iterable[int]:
-        """Yields a nonzero frame code for each trigger frame in order.
+    def _sort_frames(self) -> None:
+        """Re-inserts the triggers in ascending order of frames."""
+        items = sorted(self.items())
+        self.clear()
+        dict.update(self, items)
 
-        :return: Generator that yields trigger codes for each trigger frame.
+    def to_codes(self) -> List[int]:
+        """Returns the trigger code of every frame in order.
+
+        :return: List of `FRAME_MAX` trigger codes, with 0 for frames without one.
         """
-        for frame in range(FRAME_MAX):
-            yield self.get(frame, 0)
+        codes = [0] * FRAME_MAX
+        for frame, code in self.items():
+            codes[frame] = code
+        return codes
 
     @classmethod
     def from_codes(cls, frame_codes: Iterable[int]) -> "ActionTriggers":
         """Creates an ActionTriggers from an iterable of codes for every frame.
 
+        If `frame_codes` is a `bytes` or `bytearray` (e.g. unpacked from
+        AnimData.D2), the codes are validated in bulk instead of one by one.
+
         :param frame_codes: List of trigger codes for each frame.
         :return: New ActionTriggers dictionary.
         :raise TypeError: If a frame code is not an integer.
         :raise ValueError: If a frame code is invalid.
         """
+        if isinstance(frame_codes, (bytes, bytearray)):
+            # Bytes are never negative, so only the upper bound is checked.
+            # Triggers are sparse, so strip the empty frames at both ends in C.
+            frame_data = frame_codes[:FRAME_MAX]
+            trimmed = frame_data.lstrip(b"\0")
+            first_frame = len(frame_data) - len(trimmed)
+            trimmed = trimmed.rstrip(b"\0")
+            codes = {
+                frame: code for frame, code in enumerate(trimmed, first_frame) if code
+            }
+            max_code = max(codes.values(), default=0)
+            if max_code > 3:
+                raise ValueError(f"code must be between 1 and 3 (got {max_code!r})")
+            obj = cls.__new__(cls)  # The codes are already valid and sorted
+            dict.update(obj, codes)
+            return obj
+
         obj = cls()
         for frame, code in enumerate(frame_codes):
             if frame >= FRAME_MAX:
@@ -247,6 +330,9 @@ class Record:
         ActionTriggers dict.
     """
 
+    # Slots remove the per-instance __dict__ and speed up attribute access
+    __slots__ = ("cof_name", "frames_per_direction", "animation_speed", "triggers")
+
     cof_name: str
     frames_per_direction: int
     animation_speed: int
@@ -257,9 +343,27 @@ class Record:
 
         :return: Plain dict created from this Record.
         """
-        self_dict = dataclasses.asdict(self)
-        self_dict["triggers"] = dict(self_dict["triggers"])
-        return self_dict
+        # Faster than dataclasses.asdict(), which deep-copies every field
+        return {
+            "cof_name": self.cof_name,
+            "frames_per_direction": self.frames_per_direction,
+            "animation_speed": self.animation_speed,
+            "triggers": dict(self.triggers),
+        }
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        validator = _RECORD_FIELD_VALIDATORS.get(name)
+        if validator is not None:
+            value = validator(value)
+        object.__setattr__(self, name, value)
+
+    def __getstate__(self) -> tuple:
+        # Pickle protocols 0 and 1 cannot save slots without __getstate__()
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: tuple) -> None:
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
 
     @classmethod
     def from_dict(cls, obj: dict) -> "Record":
@@ -272,15 +376,15 @@ class Record:
         :param obj: Dictionary to convert to a Record.
         :return: New Record object.
         """
+        # Positional arguments are faster than keyword arguments
         return cls(
-            cof_name=obj["cof_name"],
-            frames_per_direction=obj["frames_per_direction"],
-            animation_speed=obj["animation_speed"],
-            triggers={int(frame): code for frame, code in obj["triggers"].items()},
+            obj["cof_name"],
+            obj["frames_per_direction"],
+            obj["animation_speed"],
+            {int(frame): code for frame, code in obj["triggers"].items()},
         )
 
 
-@_ManagedProperty(Record, name="cof_name")
 def _validate_cof_name(value: str) -> str:
     if not isinstance(value, str):
         raise TypeError(f"cof_name must be a string (got {value!r})")
@@ -295,7 +399,6 @@ def _validate_cof_name(value: str) -> str:
     return value
 
 
-@_ManagedProperty(Record, name="frames_per_direction")
 def _validate_frames_per_direction(value: int) -> int:
     if not isinstance(value, int):
         raise TypeError(f"frames_per_direction must be an integer (got {value!r})")
@@ -307,7 +410,6 @@ def _validate_frames_per_direction(value: int) -> int:
     return value
 
 
-@_ManagedProperty(Record, name="animation_speed")
 def _validate_animation_speed(value: int) -> int:
     if not isinstance(value, int):
         raise TypeError(f"animation_speed must be an integer (got {value!r})")
@@ -318,62 +420,73 @@ def _validate_animation_speed(value: int) -> int:
     return value
 
 
-@_ManagedProperty(Record, name="triggers")
 def _validate_triggers(
     value: Union[Iterable[Tuple[int, int]], Mapping[int, int]]
 ) -> ActionTriggers:
+    if isinstance(value, ActionTriggers):
+        return value.copy()  # Already validated
     return ActionTriggers(value)
 
 
-RECORD_FORMAT = f"<8sLL{FRAME_MAX}B"
+# Validators that are run whenever a Record attribute is assigned
+_RECORD_FIELD_VALIDATORS = {
+    "cof_name": _validate_cof_name,
+    "frames_per_direction": _validate_frames_per_direction,
+    "animation_speed": _validate_animation_speed,
+    "triggers": _validate_triggers,
+}
+
+# Setters that store a Record attribute in its slot without validating it
+(
+    _set_cof_name_slot,
+    _set_frames_per_direction_slot,
+    _set_animation_speed_slot,
+    _set_triggers_slot,
+) = (vars(Record)[name].__set__ for name in Record.__slots__)
+
+
+RECORD_FORMAT = f"<8sLL{FRAME_MAX}s"
+_RECORD_STRUCT = struct.Struct(RECORD_FORMAT)
+_RECORD_SIZE = _RECORD_STRUCT.size
+# Packed frame data of a record without any triggers
+_NO_TRIGGERS_FRAME_DATA = bytes(FRAME_MAX)
 
 
-def _unpack_record(buffer: bytes, offset: int = 0) -> Tuple[Record, int]:
-    """Unpacks a single Record from a buffer, optionally starting at an offset.
+def _unpack_record(fields: Tuple, offset: int) -> Record:
+    """Creates a single Record from fields unpacked with `RECORD_FORMAT`.
 
-    :param buffer: `bytes`-like object to parse.
-    :param offset: Offset of `buffer` to parse the `Record` from.
+    :param fields: Tuple of values unpacked from a record.
+    :param offset: Offset of the record in the original buffer, for errors.
     :return: The unpacked Record object.
     """
+    cof_name, frames_per_direction, animation_speed, frame_data = fields
+    # Assuming RECORD_FORMAT is correct, only the COF name and triggers can be bad
+    record = Record.__new__(Record)
     try:
-        (
-            cof_name,
-            frames_per_direction,
-            animation_speed,
-            *frame_data,
-        ) = struct.unpack_from(RECORD_FORMAT, buffer, offset=offset)
-    except struct.error as error:
-        raise AnimDataError("Cannot unpack record", offset=offset) from error
-
-    try:
-        # Assuming that RECORD_FORMAT is correct, all arguments for Record()
-        # should be correctly typed. Thus, Record() will only raise ValueError.
-        return (
-            Record(
-                cof_name=str(cof_name.split(b"\0", maxsplit=1)[0], encoding="ascii"),
-                frames_per_direction=frames_per_direction,
-                animation_speed=animation_speed,
-                triggers=ActionTriggers.from_codes(frame_data),
-            ),
-            struct.calcsize(RECORD_FORMAT),
-        )
+        cof_name = _validate_cof_name(cof_name.rstrip(b"\0").decode("ascii"))
+        _set_triggers_slot(record, ActionTriggers.from_codes(frame_data))
     except ValueError as error:
         raise AnimDataError("Invalid record field", offset=offset) from error
+    _set_cof_name_slot(record, cof_name)
+    _set_frames_per_direction_slot(record, frames_per_direction)
+    _set_animation_speed_slot(record, animation_speed)
+    return record
 
 
-def _pack_record(record: Record) -> bytes:
-    """Packs a single AnimData record.
+def _pack_triggers(triggers: ActionTriggers) -> Union[bytes, bytearray]:
+    """Packs the trigger codes of every frame for storing in AnimData.D2.
 
-    :param record: Record object to pack.
-    :return: The Record packed as a `bytes` object.
+    Faster than `bytes(triggers.to_codes())`, since it only fills trigger frames.
+
+    :param triggers: ActionTriggers to pack.
+    :return: `bytes` or `bytearray` of `FRAME_MAX` trigger codes, one per frame.
     """
-    return struct.pack(
-        RECORD_FORMAT,
-        bytes(record.cof_name, encoding="ascii"),
-        record.frames_per_direction,
-        record.animation_speed,
-        *record.triggers.to_codes(),
-    )
+    if not triggers:
+        return _NO_TRIGGERS_FRAME_DATA
+    frame_data = bytearray(FRAME_MAX)
+    for frame, code in triggers.items():
+        frame_data[frame] = code
+    return frame_data
 
 
 def _sort_records_by_cof_name(records: List[Record]) -> None:
@@ -384,25 +497,6 @@ def _sort_records_by_cof_name(records: List[Record]) -> None:
     records.sort(key=lambda record: record.cof_name)
 
 
-def _dedupe_cof_names(records: Iterable[Record]) -> Iterator[Record]:
-    """Warns about and removes Record objects with duplicate COF names.
-
-    Given an iterable of Record objects, lazily yields records that have been
-    deduplicated.
-
-    :param records: Iterable of Record objects to check.
-    :return: Generator of Record objects that lazily deduplicates and logs
-        warnings.
-    """
-    cof_names_seen = set()
-    for record in records:
-        if record.cof_name in cof_names_seen:
-            logger.warning(f"Duplicate entry found: {record.cof_name}")
-        else:
-            cof_names_seen.add(record.cof_name)
-            yield record
-
-
 def _check_out_of_bounds_triggers(record: Record) -> None:
     """Warns if a Record object has any out-of-bounds trigger frames.
 
@@ -417,52 +511,85 @@ def _check_out_of_bounds_triggers(record: Record) -> None:
             )
 
 
+def _check_records(records: Iterable[Record], dedupe: bool = False) -> List[Record]:
+    """Warns about duplicate COF names and out-of-bounds trigger frames.
+
+    :param records: Iterable of Record objects to check.
+    :param dedupe: If true, removes records with duplicate COF names.
+    :return: List of checked Record objects.
+    """
+    checked_records = []
+    cof_names_seen = set()
+    for record in records:
+        if record.cof_name in cof_names_seen:
+            logger.warning(f"Duplicate entry found: {record.cof_name}")
+            if dedupe:
+                continue
+        else:
+            cof_names_seen.add(record.cof_name)
+        _check_out_of_bounds_triggers(record)
+        checked_records.append(record)
+    return checked_records
+
+
 RECORD_COUNT_FORMAT = "<L"
+_COUNT_STRUCT = struct.Struct(RECORD_COUNT_FORMAT)
+_COUNT_SIZE = _COUNT_STRUCT.size
 
 
 def loads(data: bytes) -> List[Record]:
     """Loads the contents of AnimData.D2 from binary `data`.
 
-    :param data: Contents of AnimData.D2 in binary format.
+    :param data: Contents of AnimData.D2 in binary format, as a `bytes`-like
+        object. The data is accessed through a `memoryview` without copying.
     :return: List of `Record`s, ordered by their original order in the `data`.
     :raise AnimDataError: If the AnimData.D2 file is malformed or corrupted.
     """
-    blocks = []
+    records = []
+    # Local names are faster to look up than globals and attributes in the loop
+    append_record = records.append
+    unpack_record = _unpack_record
+
     offset = 0
-    for block_index in range(256):
-        try:
-            (record_count,) = struct.unpack_from(
-                RECORD_COUNT_FORMAT, data, offset=offset
-            )
-        except struct.error as err:
-            raise AnimDataError(
-                f"Cannot unpack record count for block {block_index!r}", offset=offset
-            ) from err
-        offset += struct.calcsize(RECORD_COUNT_FORMAT)
-
-        records = []
-        for _ in range(record_count):
-            record, record_size = _unpack_record(data, offset=offset)
-            hash_value = hash_cof_name(record.cof_name)
-            if block_index != hash_value:
+    # Use a memoryview to slice blocks of records without copying them
+    with memoryview(data).cast("B") as view:
+        for block_index in range(256):
+            try:
+                (record_count,) = _COUNT_STRUCT.unpack_from(view, offset)
+            except struct.error as err:
                 raise AnimDataError(
-                    f"Incorrect hash (COF name={record.cof_name!r}): "
-                    f"expected {block_index} but got {hash_value}",
+                    f"Cannot unpack record count for block {block_index!r}",
                     offset=offset,
-                )
-            records.append(record)
-            offset += record_size
-
-        blocks.append(records)
-
-    if offset != len(data):
-        raise AnimDataError(
-            f"Data size mismatch: "
-            f"Blocks use {offset} bytes, but binary size is {len(data)} bytes",
-            offset=offset,
-        )
+                ) from err
+            offset += _COUNT_SIZE
+
+            # Records in a block are stored contiguously, so unpack all whole
+            # records in bulk. Check them before reporting a truncated block.
+            whole_count = min(record_count, (len(view) - offset) // _RECORD_SIZE)
+            block_end = offset + whole_count * _RECORD_SIZE
+            for fields in _RECORD_STRUCT.iter_unpack(view[offset:block_end]):
+                record = unpack_record(fields, offset)
+                # Same as hash_cof_name(), since NUL padding adds 0 to the sum
+                hash_value = sum(fields[0].upper()) % 256
+                if block_index != hash_value:
+                    raise AnimDataError(
+                        f"Incorrect hash (COF name={record.cof_name!r}): "
+                        f"expected {block_index} but got {hash_value}",
+                        offset=offset,
+                    )
+                append_record(record)
+                offset += _RECORD_SIZE
+            if whole_count < record_count:
+                raise AnimDataError("Cannot unpack record", offset=offset)
+
+        if offset != len(view):
+            raise AnimDataError(
+                f"Data size mismatch: "
+                f"Blocks use {offset} bytes, but binary size is {len(view)} bytes",
+                offset=offset,
+            )
 
-    return list(itertools.chain.from_iterable(blocks))
+    return records
 
 
 def load(file: BinaryIO) -> List[Record]:
@@ -472,25 +599,61 @@ def load(file: BinaryIO) -> List[Record]:
     :return: List of Record objects, maintaining their original order in `file`.
     :raise AnimDataError: If the AnimData.D2 file is malformed or corrupted.
     """
-    return loads(file.read())
+    try:
+        # Map the file into memory to avoid copying its contents, if possible
+        mapped_file = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError):
+        # Not a regular file (e.g. BytesIO or a pipe), or the file is empty
+        return loads(file.read())
+
+    with mapped_file:
+        # Like file.read(), load from the current position to the end of file.
+        # All views must be released before the mapping can be closed.
+        with memoryview(mapped_file) as view, view[file.tell() :] as data:
+            records = loads(data)
+        file.seek(0, io.SEEK_END)
+    return records
 
 
-def dumps(records: Iterable[Record]) -> bytearray:
-    """Packs AnimData records into AnimData.D2 hash table format.
+def _make_hash_table(records: Iterable[Record]) -> List[List[Record]]:
+    """Distributes Records into the 256 blocks of the AnimData.D2 hash table.
 
     :param records: Iterable of Record objects.
-    :return: `bytearray` containing the packed AnimData.D2 file.
+    :return: List of 256 blocks, each being a list of `Record`s whose COF name
+        hashes to the index of the block.
     """
     hash_table = [[] for _ in range(256)]
     for record in records:
         hash_value = hash_cof_name(record.cof_name)
         hash_table[hash_value].append(record)
+    return hash_table
+
 
-    packed_data = bytearray()
+def dumps(records: Iterable[Record]) -> bytearray:
+    """Packs AnimData records into AnimData.D2 hash table format.
+
+    :param records: Iterable of Record objects.
+    :return: `bytearray` containing the packed AnimData.D2 file.
+    """
+    hash_table = _make_hash_table(records)
+
+    # The output size is known in advance, so pack into a preallocated buffer
+    record_count = sum(map(len, hash_table))
+    packed_data = bytearray(len(hash_table) * _COUNT_SIZE + record_count * _RECORD_SIZE)
+    offset = 0
     for block in hash_table:
-        packed_data += struct.pack(RECORD_COUNT_FORMAT, len(block))
+        _COUNT_STRUCT.pack_into(packed_data, offset, len(block))
+        offset += _COUNT_SIZE
         for record in block:
-            packed_data += _pack_record(record)
+            _RECORD_STRUCT.pack_into(
+                packed_data,
+                offset,
+                record.cof_name.encode("ascii"),
+                record.frames_per_direction,
+                record.animation_speed,
+                _pack_triggers(record.triggers),
+            )
+            offset += _RECORD_SIZE
 
     return packed_data
 
@@ -504,6 +667,12 @@ def dump(records: Iterable[Record], file: BinaryIO) -> None:
     file.write(dumps(records))
 
 
+# Names of the frame data columns in tabbed text files, in order of frames
+_FRAME_DATA_COLUMNS = tuple(f"FrameData{frame:03}" for frame in range(FRAME_MAX))
+# Maps the text of each valid trigger code cell to its value
+_TRIGGER_CODE_CELLS = {"0": 0, "1": 1, "2": 2, "3": 3}
+
+
 def _get_column_index(column_indices: Mapping[int, str], column_name: str) -> int:
     """Helper that retrieves the index of a column name."""
     try:
@@ -531,6 +700,49 @@ def _get_int_cell(row: List[str], column_index: int) -> int:
         ) from error
 
 
+def _get_triggers(
+    row: List[str],
+    get_frame_data: Callable[[List[str]], Tuple[str, ...]],
+    frame_data_indices: List[int],
+) -> ActionTriggers:
+    """Helper that retrieves the frame data cells of a CSV row as ActionTriggers."""
+    try:
+        frame_cells = get_frame_data(row)
+        # Convert all cells at once, looking up plain trigger codes faster than
+        # int() parses them. bytes() rejects codes unfit for AnimData.D2.
+        try:
+            frame_data = bytes(map(_TRIGGER_CODE_CELLS.__getitem__, frame_cells))
+        except KeyError:
+            frame_data = bytes(map(int, frame_cells))
+        return ActionTriggers.from_codes(frame_data)
+    except (IndexError, ValueError):
+        # Retrieve and validate the cells one by one to report the bad cell
+        return ActionTriggers.from_codes(
+            _get_int_cell(row, index) for index in frame_data_indices
+        )
+
+
+def _read_tabbed_rows(file: Iterable[str]) -> Iterator[List[str]]:
+    """Lazily splits each line of a tabbed text file into a list of cells.
+
+    Lines are split with `str.split()`, which is much faster than `csv.reader`,
+    until a quote character is found. The rest of the file is parsed with
+    `csv.reader`, so that quoted cells are read correctly.
+
+    :param file: Iterable of lines in the tabbed text file.
+    :return: Generator that yields a list of cells for each row.
+    :raise csv.Error: If the file cannot be parsed by `csv.reader`.
+    """
+    lines = iter(file)
+    for line in lines:
+        if '"' in line:
+            yield from csv.reader(itertools.chain([line], lines), dialect="excel-tab")
+            return
+        line = line.rstrip("\r\n")
+        # csv.reader returns an empty row for empty lines
+        yield line.split("\t") if line else []
+
+
 def load_txt(file: Iterable[str]) -> List[Record]:
     """Loads AnimData records from a tabbed text file.
 
@@ -541,7 +753,7 @@ def load_txt(file: Iterable[str]) -> List[Record]:
     :return: List of `Record`s loaded from the `file`.
     :raises TabbedTextError: If the tabbed text file cannot be loaded.
     """
-    reader = csv.reader(file, dialect="excel-tab")
+    reader = _read_tabbed_rows(file)
     try:
         column_names = next(reader)
     except StopIteration:  # File is empty
@@ -555,22 +767,23 @@ def load_txt(file: Iterable[str]) -> List[Record]:
     frames_per_direction_index = _get_column_index(column_indices, "FramesPerDirection")
     animation_speed_index = _get_column_index(column_indices, "AnimationSpeed")
     frame_data_indices = [
-        _get_column_index(column_indices, f"FrameData{frame:03}")
-        for frame in range(FRAME_MAX)
+        _get_column_index(column_indices, column_name)
+        for column_name in _FRAME_DATA_COLUMNS
     ]
+    # Fetches all frame data cells of a row in a single call
+    get_frame_data = operator.itemgetter(*frame_data_indices)
 
     records = []
     try:
         for row_num, row in enumerate(reader):
-            record = Record(
-                cof_name=_get_cell(row, cof_name_index),
-                frames_per_direction=_get_int_cell(row, frames_per_direction_index),
-                animation_speed=_get_int_cell(row, animation_speed_index),
-                triggers=ActionTriggers.from_codes(
-                    _get_int_cell(row, index) for index in frame_data_indices
-                ),
+            records.append(
+                Record(
+                    _get_cell(row, cof_name_index),
+                    _get_int_cell(row, frames_per_direction_index),
+                    _get_int_cell(row, animation_speed_index),
+                    _get_triggers(row, get_frame_data, frame_data_indices),
+                )
             )
-            records.append(record)
     except TabbedTextError as error:
         # Add extra info for debugging
         error.row = row_num
@@ -584,6 +797,10 @@ def load_txt(file: Iterable[str]) -> List[Record]:
     return records
 
 
+# Characters that cause a cell to be quoted by the "excel-tab" CSV dialect
+_TXT_SPECIAL_CHARS = frozenset('\t"\r\n')
+
+
 def dump_txt(records: Iterable[Record], file: TextIO) -> None:
     """Saves AnimData records to a tabbed text file.
 
@@ -598,27 +815,71 @@ def dump_txt(records: Iterable[Record], file: TextIO) -> None:
             "CofName",
             "FramesPerDirection",
             "AnimationSpeed",
-            *(f"FrameData{frame:03}" for frame in range(FRAME_MAX)),
+            *_FRAME_DATA_COLUMNS,
         ]
     )
 
+    # Most records share their triggers, so join each distinct set only once.
+    # Triggers are sparse, so reuse the cells and reset only the last triggers.
+    joined_frame_data = {}
+    frame_cells = ["0"] * FRAME_MAX
+    prev_trigger_items = ()
     for record in records:
-        writer.writerow(
-            [
-                record.cof_name,
-                record.frames_per_direction,
-                record.animation_speed,
-                *record.triggers.to_codes(),
-            ]
+        trigger_items = tuple(record.triggers.items())
+        frame_data = joined_frame_data.get(trigger_items)
+        if frame_data is None:
+            for frame, _ in prev_trigger_items:
+                frame_cells[frame] = "0"
+            for frame, code in trigger_items:
+                frame_cells[frame] = str(code)
+            prev_trigger_items = trigger_items
+            frame_data = joined_frame_data[trigger_items] = "\t".join(frame_cells)
+
+        cof_name = record.cof_name
+        row_tail = (
+            f"{record.frames_per_direction}\t{record.animation_speed}\t{frame_data}"
         )
+        if _TXT_SPECIAL_CHARS.isdisjoint(cof_name):
+            # No cell needs quoting, so bypass the csv module
+            file.write(f"{cof_name}\t{row_tail}\r\n")
+        else:
+            writer.writerow([cof_name, *row_tail.split("\t")])
+
+
+def _dump_json(obj: Any, file: TextIO) -> None:
+    """Writes an object to a text file as JSON, indented by 2 spaces.
+
+    If orjson is installed, it is used instead of the much slower `json` module.
 
+    :param obj: Object to serialize.
+    :param file: Writable text file object.
+    """
+    if orjson:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        file.write(orjson.dumps(obj, option=option).decode("utf-8"))
+    else:
+        # Faster than json.dump(), which writes many small chunks separately
+        file.write(json.dumps(obj, indent=2))
+
+
+def _load_json_records(file: TextIO) -> List[Record]:
+    """Reads AnimData records from a JSON text file.
 
-def _consume(iterator: Iterator) -> None:
-    """Efficiently consumes an iterator, doing nothing.
+    If orjson is installed, it is tried first. If it fails or its records are
+    invalid, the `json` module parses the file again to get the same result.
 
-    Based on https://docs.python.org/3/library/itertools.html#itertools-recipes
+    :param file: Readable text file object.
+    :return: List of `Record`s loaded from the `file`.
+    :raise json.JSONDecodeError: If the file does not contain valid JSON.
     """
-    collections.deque(iterator, maxlen=0)
+    json_text = file.read()
+    if orjson:
+        try:
+            return list(map(Record.from_dict, orjson.loads(json_text)))
+        except (TypeError, ValueError):
+            # orjson rejects e.g. NaN, and parses integers over 64 bits as floats
+            pass
+    return list(map(Record.from_dict, json.loads(json_text)))
 
 
 def _init_subparser_compile(parser: argparse.ArgumentParser) -> None:
@@ -650,18 +911,11 @@ def _cli_compile(args: argparse.Namespace) -> None:
             records = load_txt(source_file)
     elif args.json:
         with open(args.source) as source_file:
-            json_data = json.load(source_file)
-        records = list(map(Record.from_dict, json_data))
+            records = _load_json_records(source_file)
     else:
         raise ValueError("No file format specified")
 
-    if args.dedupe:
-        records = list(_dedupe_cof_names(records))
-    else:
-        _consume(_dedupe_cof_names(records))
-
-    for record in records:
-        _check_out_of_bounds_triggers(record)
+    records = _check_records(records, dedupe=args.dedupe)
     if args.sort:
         _sort_records_by_cof_name(records)
 
@@ -696,13 +950,7 @@ def _cli_decompile(args: argparse.Namespace):
     with open(args.animdata_d2, mode="rb") as animdata_d2_file:
         records = load(animdata_d2_file)
 
-    if args.dedupe:
-        records = list(_dedupe_cof_names(records))
-    else:
-        _consume(_dedupe_cof_names(records))
-
-    for record in records:
-        _check_out_of_bounds_triggers(record)
+    records = _check_records(records, dedupe=args.dedupe)
     if args.sort:
         _sort_records_by_cof_name(records)
 
@@ -712,7 +960,7 @@ def _cli_decompile(args: argparse.Namespace):
     elif args.json:
         json_data = [record.make_dict() for record in records]
         with open(args.target, mode="w") as target_file:
-            json.dump(json_data, target_file, indent=2)
+            _dump_json(json_data, target_file)
     else:
         raise ValueError("No file format specified")
 
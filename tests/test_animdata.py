@@ -1,5 +1,6 @@
 """Unit tests for loading and saving AnimData.D2 files."""
 
+import tempfile
 import unittest
 from io import BytesIO
 from typing import Iterable, List
@@ -39,6 +40,21 @@ ANIMDATA_BAD_RECORD_COUNT = (
     + b"\x00\x00\x00\x00" * 255
 )
 
+# Invalid AnimData.D2 with an invalid record followed by a truncated record
+ANIMDATA_BAD_RECORD_THEN_TRUNCATED = (
+    # Start of block 0
+    b"\x02\x00\x00\x00"  # # of records in block
+    # start of record 0 in block 0
+    + b"AWS1HTH\x00"  # COF name (hash value == 0)
+    + b"\x09\x00\x00\x00"  # frames_per_direction
+    + b"\x07\x00\x00\x00"  # animation_speed
+    + b"\x00\x09"  # Frame 1 has an invalid trigger code
+    + b"\x00" * 142  # All other frames have no trigger code
+    # End of record 0 in block 0
+    # Record 1 in block 0 is cut off after its COF name
+    + b"AWS1HTH\x00"
+)
+
 # Well-formatted AnimData.D2 with unexpected extra data
 ANIMDATA_EXTRA_DATA = VALID_ANIMDATA + b"\x00"
 
@@ -75,6 +91,22 @@ class TestLoadAnimData(unittest.TestCase):
         with self.assertRaises(AnimDataError):
             self.loads(ANIMDATA_BAD_RECORD_COUNT)
 
+    def test_bad_record_before_truncated_record(self) -> None:
+        """Tests if loading reports an invalid record that precedes a truncated
+        record in the same block."""
+        with self.assertRaises(AnimDataError) as context:
+            self.loads(ANIMDATA_BAD_RECORD_THEN_TRUNCATED)
+        self.assertEqual(context.exception.message, "Invalid record field")
+        self.assertEqual(context.exception.offset, 4)
+
+    def test_truncated_record(self) -> None:
+        """Tests if loading reports the offset of a truncated record."""
+        with self.assertRaises(AnimDataError) as context:
+            # Cut off after the COF name of the second record in block 0
+            self.loads(ANIMDATA_BAD_RECORD_COUNT[: 4 + 160 + 8])
+        self.assertEqual(context.exception.message, "Cannot unpack record")
+        self.assertEqual(context.exception.offset, 4 + 160)
+
     def test_extra_data(self) -> None:
         """Tests if loading fails when the file contains extra bytes."""
         with self.assertRaises(AnimDataError):
@@ -91,6 +123,19 @@ class TestLoadFile(TestLoadAnimData):
         return d2animdata.load(animdata_file)
 
 
+class TestLoadRealFile(TestLoadAnimData):
+    """Test case for loading an AnimData.D2 file on disk with load(), which
+    memory-maps the file if possible."""
+
+    @staticmethod
+    def loads(data: bytes) -> List[Record]:
+        """Wrapper for d2animdata.load() that uses a temporary file."""
+        with tempfile.TemporaryFile() as animdata_file:
+            animdata_file.write(data)
+            animdata_file.seek(0)
+            return d2animdata.load(animdata_file)
+
+
 class TestDumpAnimData(unittest.TestCase):
     """Test case for dumping AnimData.D2 data with dumps()."""
 
@@ -120,3 +165,12 @@ class TestDumpFile(unittest.TestCase):
         animdata_file = BytesIO()
         d2animdata.dump(records, animdata_file)
         return animdata_file.getvalue()
+
+    def test_dump_unpackable_record(self):
+        """Tests if dump() writes nothing when a Record cannot be packed."""
+        # Non-ASCII COF names pass validation, but cannot be stored in AnimData.D2
+        records = [*VALID_RECORDS, Record("\xc4BCDEFG", 1, 1, {})]
+        animdata_file = BytesIO()
+        with self.assertRaises(UnicodeEncodeError):
+            d2animdata.dump(records, animdata_file)
+        self.assertEqual(animdata_file.getvalue(), b"")
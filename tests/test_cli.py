@@ -1,8 +1,11 @@
 """Integration tests for the command-line interface."""
 
+import json
 import logging
 import unittest
+from functools import partial
 from io import BytesIO, StringIO
+from typing import Any
 from unittest import mock
 
 import d2animdata
@@ -84,6 +87,25 @@ DEDUPED_JSON = """[
   }
 ]"""
 
+# JSON with invalid records, which orjson parses differently from the json
+# module: an integer outside the 64-bit range, and NaN
+INVALID_RECORD_JSON = [
+    """[{"cof_name": "BVS1HTH", "frames_per_direction": 99999999999999999999,
+    "animation_speed": 7, "triggers": {}}]""",
+    """[{"cof_name": "BVS1HTH", "frames_per_direction": 9,
+    "animation_speed": NaN, "triggers": {}}]""",
+]
+
+
+def _load_json_records_or_error(json_text: str) -> Any:
+    """Loads records from JSON text, returning the type and message of the
+    error instead if loading fails."""
+    try:
+        # pylint: disable=protected-access
+        return d2animdata._load_json_records(StringIO(json_text))
+    except (TypeError, ValueError) as error:
+        return type(error), str(error)
+
 
 class TestCompile(unittest.TestCase):
     """Test case for the `compile` command."""
@@ -273,3 +295,61 @@ class TestDecompile(unittest.TestCase):
         )
         json_file.close.assert_called_once_with()
         self.assertEqual(json_file.getvalue(), DEDUPED_JSON)
+
+
+@unittest.skipUnless(d2animdata.orjson, "orjson is not installed")
+class TestOrjson(unittest.TestCase):
+    """Test case for reading and writing JSON with the optional orjson module."""
+
+    # pylint: disable=protected-access
+
+    def test_dump_json(self) -> None:
+        """Tests if orjson writes the same JSON as the json module."""
+        records = d2animdata.loads(VALID_ANIMDATA) + d2animdata.loads(
+            DUPLICATE_COF_ANIMDATA
+        )
+        json_data = [record.make_dict() for record in records]
+
+        orjson_file = StringIO()
+        d2animdata._dump_json(json_data, orjson_file)
+        json_file = StringIO()
+        with mock.patch("d2animdata.orjson", None):
+            d2animdata._dump_json(json_data, json_file)
+        self.assertEqual(orjson_file.getvalue(), json_file.getvalue())
+
+    def test_load_json(self) -> None:
+        """Tests if orjson reads the same records as the json module, or fails
+        with the same error."""
+        for json_text in [VALID_JSON, DUPLICATE_COF_JSON, *INVALID_RECORD_JSON]:
+            with self.subTest(json_text=json_text):
+                with mock.patch("d2animdata.orjson", None):
+                    expected = _load_json_records_or_error(json_text)
+                self.assertEqual(_load_json_records_or_error(json_text), expected)
+
+
+class TestLoadJsonFallback(unittest.TestCase):
+    """Test case for falling back to the json module when orjson fails."""
+
+    def test_orjson_parse_error(self) -> None:
+        """Tests if JSON rejected by orjson is parsed with the json module."""
+        orjson_stub = mock.Mock(loads=mock.Mock(side_effect=ValueError))
+        for json_text in [VALID_JSON, *INVALID_RECORD_JSON]:
+            with self.subTest(json_text=json_text):
+                with mock.patch("d2animdata.orjson", None):
+                    expected = _load_json_records_or_error(json_text)
+                with mock.patch("d2animdata.orjson", orjson_stub):
+                    actual = _load_json_records_or_error(json_text)
+                self.assertEqual(actual, expected)
+
+    def test_orjson_float_integers(self) -> None:
+        """Tests if integers that orjson parsed as floats are parsed again with
+        the json module."""
+        # Like orjson does for integers outside the 64-bit range
+        orjson_stub = mock.Mock(loads=partial(json.loads, parse_int=float))
+        json_text = INVALID_RECORD_JSON[0]
+        with mock.patch("d2animdata.orjson", None):
+            expected = _load_json_records_or_error(json_text)
+        with mock.patch("d2animdata.orjson", orjson_stub):
+            actual = _load_json_records_or_error(json_text)
+        self.assertEqual(actual, expected)
+        self.assertEqual(actual[0], ValueError)
@@ -1,5 +1,6 @@
 """Unit tests for model classes."""
 
+import pickle
 import unittest
 
 from d2animdata import ActionTriggers, Record
@@ -26,6 +27,28 @@ class TestRecord(unittest.TestCase):
         self.record.animation_speed = 0xFFFFFFFF
         self.record.triggers = {0: 1, 1: 2}
 
+    def test_triggers_copied(self) -> None:
+        """Tests if assigning an ActionTriggers to triggers stores a copy."""
+        triggers = ActionTriggers({0: 1, 1: 2})
+        self.record.triggers = triggers
+        triggers[2] = 3
+        self.assertIsInstance(self.record.triggers, ActionTriggers)
+        self.assertEqual(self.record.triggers, {0: 1, 1: 2})
+
+    def test_triggers_none(self) -> None:
+        """Tests if assigning None to triggers stores empty ActionTriggers."""
+        record = Record("ABCDEFG", 1, 1, None)
+        self.assertIsInstance(record.triggers, ActionTriggers)
+        self.assertEqual(record.triggers, {})
+
+    def test_pickle(self) -> None:
+        """Tests if a Record object can be pickled with every protocol."""
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(protocol=protocol):
+                record = pickle.loads(pickle.dumps(self.record, protocol))
+                self.assertEqual(record, self.record)
+                self.assertIsInstance(record.triggers, ActionTriggers)
+
     def test_invalid_cof_name_type(self) -> None:
         """Tests if cof_name rejects invalid types."""
         for bad_value in [None, 1, b"bytestr"]:
@@ -134,6 +157,10 @@ class TestActionTriggers(unittest.TestCase):
         # pylint: disable=no-self-use
         ActionTriggers({5: 1, 6: 2, 7: 3})
 
+    def test_init_none(self) -> None:
+        """Tests if ActionTriggers treats None as no items, like UserDict."""
+        self.assertEqual(ActionTriggers(None), {})
+
     def test_invalid_frame_type(self) -> None:
         """Tests if ActionTriggers rejects invalid frame types."""
         for bad_value in [None, 1.1, "1"]:
@@ -166,3 +193,76 @@ class TestActionTriggers(unittest.TestCase):
             with self.subTest(bad_value=bad_value):
                 with self.assertRaises(ValueError):
                     ActionTriggers({0: bad_value})
+
+    def test_from_codes_bytes(self) -> None:
+        """Tests if ActionTriggers.from_codes() accepts bytes and bytearray."""
+        codes = [0, 0, 1, 0, 2, 3] + [0] * 150
+        expected = ActionTriggers.from_codes(codes)
+        self.assertEqual(expected, {2: 1, 4: 2, 5: 3})
+        for frame_codes in [bytes(codes), bytearray(codes)]:
+            with self.subTest(frame_codes=type(frame_codes)):
+                self.assertEqual(ActionTriggers.from_codes(frame_codes), expected)
+
+    def test_from_codes_bytes_invalid_code(self) -> None:
+        """Tests if ActionTriggers.from_codes() rejects bytes containing codes
+        outside the allowed range."""
+        with self.assertRaises(ValueError):
+            ActionTriggers.from_codes(bytes([0, 1, 4]))
+
+    def test_dict_methods_validate(self) -> None:
+        """Tests if dict methods that add triggers reject invalid values."""
+        triggers = ActionTriggers({5: 1})
+        for method, args in [
+            (triggers.update, ({144: 1},)),
+            (triggers.update, ([(0, 4)],)),
+            (triggers.setdefault, (0, 4)),
+            (triggers.__ior__, ({-1: 1},)),
+        ]:
+            with self.subTest(method=method.__name__, args=args):
+                with self.assertRaises(ValueError):
+                    method(*args)
+        self.assertEqual(triggers, {5: 1})
+
+    def test_merge_operator(self) -> None:
+        """Tests if the | operator creates a new, validated ActionTriggers."""
+        triggers = ActionTriggers({1: 1, 5: 2})
+        for merged, expected in [
+            (triggers | {0: 3, 5: 1}, {0: 3, 1: 1, 5: 1}),
+            ({0: 3, 5: 1} | triggers, {0: 3, 1: 1, 5: 2}),
+        ]:
+            with self.subTest(expected=expected):
+                self.assertIsInstance(merged, ActionTriggers)
+                self.assertEqual(list(merged.items()), list(expected.items()))
+        self.assertEqual(triggers, {1: 1, 5: 2})
+
+        for make_merged in [lambda: triggers | {200: 9}, lambda: {200: 9} | triggers]:
+            with self.assertRaises(ValueError):
+                make_merged()
+
+    def test_popitem(self) -> None:
+        """Tests if popitem() removes the trigger with the lowest frame, like
+        the UserDict-based ActionTriggers did."""
+        triggers = ActionTriggers({5: 2, 1: 1})
+        self.assertEqual(triggers.popitem(), (1, 1))
+        self.assertEqual(triggers.popitem(), (5, 2))
+        with self.assertRaises(KeyError):
+            triggers.popitem()
+
+    def test_sorted_iteration(self) -> None:
+        """Tests if ActionTriggers iterates in ascending order of frames."""
+        triggers = ActionTriggers({40: 2, 3: 1})
+        triggers[7] = 3
+        self.assertEqual(list(triggers), [3, 7, 40])
+        self.assertEqual(list(triggers.keys()), [3, 7, 40])
+        self.assertEqual(list(triggers.items()), [(3, 1), (7, 3), (40, 2)])
+        self.assertEqual(list(triggers.values()), [1, 3, 2])
+        self.assertEqual(list(triggers.copy().items()), list(triggers.items()))
+
+    def test_sorted_after_setitem(self) -> None:
+        """Tests if assigning triggers one at a time keeps them sorted."""
+        triggers = ActionTriggers()
+        for frame in [10, 20, 15, 20, 0, 143]:
+            triggers[frame] = 1
+        triggers[15] = 2
+        self.assertEqual(list(triggers.items()), sorted(triggers.items()))
+        self.assertEqual(triggers, {0: 1, 10: 1, 15: 2, 20: 1, 143: 1})
@@ -51,6 +51,30 @@ class TestLoadTabbedText(unittest.TestCase):
         records = load_txt(tabbed_txt)
         self.assertEqual(records, RECORDS_VALID)
 
+    def test_reordered_columns(self) -> None:
+        """Tests if a tabbed text file with reordered columns can be loaded."""
+        frame_data_columns = [f"FrameData{i:03}" for i in range(144)]
+        tabbed_txt_content = (
+            # Header row, with FrameData000 moved to the end
+            "CofName\tFramesPerDirection\tAnimationSpeed\t"
+            + "\t".join(frame_data_columns[1:] + frame_data_columns[:1])
+            + "\r\n"
+            # Record 0
+            + ("00A1HTH\t5\t256\t1\t2\t3" + "\t0" * 140 + "\t2\r\n")
+        )
+        records = load_txt(StringIO(tabbed_txt_content, newline=""))
+        self.assertEqual(
+            records,
+            [
+                Record(
+                    cof_name="00A1HTH",
+                    frames_per_direction=5,
+                    animation_speed=256,
+                    triggers={0: 2, 1: 1, 2: 2, 3: 3},
+                )
+            ],
+        )
+
     def test_bad_records(self) -> None:
         """Tests if loading a tabbed text file containing bad records causes an
         error.